@@ -1,111 +1,412 @@
 import os
-import pandas as pd
+import sys
+import csv
+import json
+import asyncio
+import httpx
+import orjson
+from email.parser import BytesParser
+from urllib.parse import urlencode
 from dotenv import load_dotenv
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from collections import Counter
+from collections import Counter, defaultdict
 from tqdm import tqdm
 
-def coletar_dados_completos(video_id, api_keys):
+API_URL = "https://www.googleapis.com/youtube/v3"
+BATCH_URL = "https://www.googleapis.com/batch/youtube/v3"
+BATCH_BOUNDARY = "lote_redes_complexas"
+TAMANHO_LOTE = 50  # limite de sub-requisições por lote aceito pela API
+WORKERS_POR_CHAVE = 4  # lotes de respostas em andamento ao mesmo tempo para cada chave
+MAX_TENTATIVAS = 5
+TENTATIVAS_LOTE = 3  # vezes que um lote de respostas que falhou volta para a fila
+# Limite global de requisições em andamento, somando todas as chaves.
+LIMITE_REQUISICOES = asyncio.Semaphore(64)
+# A API só comprime as respostas com gzip quando o User-Agent contém "gzip".
+HEADERS = {"Accept-Encoding": "gzip", "User-Agent": "redes-complexas (gzip)"}
+
+COMMENTS_FILE = 'comentarios.csv'
+STATE_FILE = '.coletor_state.json'
+EDGES_FILE = 'rede_usuarios_arestas.csv'
+NODES_FILE = 'rede_usuarios_nos.csv'
+
+
+def montar_fields(collect_text):
+    # Máscaras 'fields' com apenas os campos usados na coleta, reduzindo o tamanho
+    # das respostas. Sem o texto, 'textOriginal' também deixa de ser pedido.
+    campos_snippet = "authorDisplayName,textOriginal,likeCount,publishedAt" if collect_text else "authorDisplayName,likeCount,publishedAt"
+    fields_threads = (
+        f"nextPageToken,items(snippet(topLevelComment(id,snippet({campos_snippet})),totalReplyCount),"
+        f"replies(comments(id,snippet({campos_snippet}))))"
+    )
+    fields_replies = f"nextPageToken,items(id,snippet({campos_snippet}))"
+    return fields_threads, fields_replies
+
+
+async def enviar(client, method, url, **kwargs):
+    # Envia a requisição e, quando a API pede para reduzir o ritmo (429) ou falha
+    # do lado do servidor (5xx), espera o tempo indicado em Retry-After (ou um
+    # intervalo exponencial) e tenta de novo. Falhas de conexão (timeout, conexão
+    # recusada ou encerrada) também são repetidas, com o intervalo exponencial.
+    for tentativa in range(MAX_TENTATIVAS):
+        try:
+            async with LIMITE_REQUISICOES:
+                resp = await client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if tentativa == MAX_TENTATIVAS - 1:
+                raise
+            await asyncio.sleep(2 ** tentativa)
+            continue
+        if not (resp.status_code == 429 or resp.is_server_error) or tentativa == MAX_TENTATIVAS - 1:
+            return resp
+        try:
+            espera = float(resp.headers.get("Retry-After", 2 ** tentativa))
+        except ValueError:
+            espera = 2 ** tentativa
+        await asyncio.sleep(espera)
+
+
+async def chamar_api(client, endpoint, api_key, **params):
+    # Faz um GET no endpoint REST da API e devolve o JSON da resposta.
+    # Erros da API viram HTTPStatusError com o corpo do erro na mensagem,
+    # para que o motivo (ex: 'quotaExceeded') possa ser inspecionado.
+    params = {k: v for k, v in params.items() if v is not None}
+    params["key"] = api_key
+    resp = await enviar(client, "GET", f"/{endpoint}", params=params)
+    if resp.is_error:
+        raise httpx.HTTPStatusError(resp.text, request=resp.request, response=resp)
+    return orjson.loads(resp.content)
+
+
+async def chamar_api_em_lote(client, endpoint, api_key, lista_params):
+    # Agrupa várias chamadas GET ao mesmo endpoint em uma única requisição
+    # multipart ao endpoint de lote da API. Devolve, na mesma ordem de
+    # 'lista_params', o JSON de cada sub-resposta (ou None quando ela falhou).
+    # Se alguma sub-resposta indicar cota esgotada, o lote inteiro falha.
+    partes = []
+    for i, params in enumerate(lista_params):
+        params = {k: v for k, v in params.items() if v is not None}
+        params["key"] = api_key
+        partes.append(
+            f"--{BATCH_BOUNDARY}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <item{i}>\r\n\r\n"
+            f"GET /youtube/v3/{endpoint}?{urlencode(params)} HTTP/1.1\r\n\r\n"
+        )
+    corpo = "".join(partes) + f"--{BATCH_BOUNDARY}--\r\n"
+    headers = {"Content-Type": f"multipart/mixed; boundary={BATCH_BOUNDARY}"}
+    resp = await enviar(client, "POST", BATCH_URL, content=corpo.encode("utf-8"), headers=headers)
+    if resp.is_error:
+        raise httpx.HTTPStatusError(resp.text, request=resp.request, response=resp)
+    conteudo = resp.content
+    content_type = resp.headers["Content-Type"]
+
+    # Cada parte da resposta é uma resposta HTTP completa: linha de status,
+    # cabeçalhos e o corpo JSON, identificada por 'Content-ID: <response-itemN>'.
+    mensagem = BytesParser().parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + conteudo)
+    respostas = [None] * len(lista_params)
+    for parte in mensagem.get_payload():
+        indice = int(parte["Content-ID"].strip("<>").rsplit("item", 1)[-1])
+        linha_status, _, resto = parte.get_payload(decode=True).partition(b"\n")
+        corpo_json = resto.split(b"\r\n\r\n", 1)[-1]
+        if int(linha_status.split(b" ")[1]) >= 400:
+            if b"quotaExceeded" in corpo_json:
+                raise httpx.HTTPStatusError(corpo_json.decode("utf-8", "replace"), request=resp.request, response=resp)
+            continue
+        respostas[indice] = orjson.loads(corpo_json)
+    return respostas
+
+
+def carregar_estado(state_path, video_id):
+    # Lê o estado de uma coleta interrompida do mesmo vídeo, se existir.
+    if not os.path.exists(state_path):
+        return {}
+    with open(state_path, encoding='utf-8') as f:
+        state = json.load(f)
+    return state if state.get('video_id') == video_id else {}
+
+
+def salvar_estado(state_path, video_id, thread_token, offset):
+    # Grava o token da próxima página de comentários e até onde o CSV de
+    # comentários está completo. A troca do arquivo é atômica, para que uma
+    # interrupção durante a escrita não corrompa o estado anterior.
+    tmp_path = state_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'video_id': video_id, 'thread_token': thread_token, 'offset': offset}, f)
+    os.replace(tmp_path, state_path)
+
+
+def reconstruir_contagens(comments_path, n_comments, n_replies, edges):
+    # Refaz as contagens da rede a partir dos comentários já gravados no CSV,
+    # ao retomar uma coleta. As respostas sempre aparecem depois do comentário pai.
+    author_by_comment = {}
+    with open(comments_path, newline='', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            author = sys.intern(row['author'])
+            if not row['parent_id']:
+                n_comments[author] += 1
+                author_by_comment[row['comment_id']] = author
+            else:
+                author_parent = author_by_comment[row['parent_id']]
+                n_comments.setdefault(author, 0)
+                edges[(author, author_parent)] += 1
+                n_replies[author_parent] += 1
+
+
+async def coletar_dados_completos(video_id, api_keys, out_dir='data/raw', collect_text=True):
     # Coleta de forma integrada a rede e o conteúdo textual dos comentários,
-    # trocando de chave de API automaticamente quando a cota se esgota.
+    # usando todas as chaves de API ao mesmo tempo e descartando as que têm a
+    # cota esgotada. As respostas de cada página são buscadas em lotes paralelos.
+    # Com collect_text=False, a coluna 'text' do CSV de comentários fica vazia
+    # e o texto nem é baixado da API.
     
     if not api_keys:
         print("ERRO: Nenhuma chave de API foi encontrada.")
         return
 
-    current_key_index = 0
-    api_key = api_keys[current_key_index]
-    youtube = build("youtube", "v3", developerKey=api_key)
-    print(f"Conexão com a API estabelecida usando a Chave #{current_key_index + 1}.")
+    os.makedirs(out_dir, exist_ok=True)
+    comments_path = os.path.join(out_dir, COMMENTS_FILE)
+    state_path = os.path.join(out_dir, STATE_FILE)
+    fields_threads, fields_replies = montar_fields(collect_text)
 
-    nodes = {}
-    edges = []
-    all_comments = []
+    # Chaves ainda com cota; a busca de respostas distribui os lotes entre todas elas.
+    active_keys = list(api_keys)
+    reply_queue = asyncio.Queue()
+    # Falhas (que não são de cota) por comentário e os comentários que esgotaram as tentativas.
+    reply_failures = Counter()
+    replies_failed = []
 
-    # PARTE 1: COLETA DE COMENTÁRIOS E RESPOSTAS
-    print("\nIniciando a coleta de dados completos...")
-    
-    # <-- MUDANÇA AQUI: Adicionado 'bar_format' para simplificar a saída.
-    progress_bar = tqdm(desc="Comentários Principais Processados", unit=" cmt", bar_format="{desc}: {n_fmt} {unit}")
-    
-    next_page_token_threads = None
-    
-    while True:
+    # Contagens por autor em dicionários paralelos (um por coluna do arquivo de nós).
+    n_comments = defaultdict(int)
+    n_replies = defaultdict(int)
+    edges = Counter()
+    # Métodos usados a cada comentário ficam ligados a nomes locais, evitando a
+    # busca do atributo em cada registro.
+    register_author = n_comments.setdefault
+    # Quantos comentários tiveram as respostas completas na própria página ('inline')
+    # e quantos precisaram de chamadas a comments.list ('comments_list').
+    reply_sources = Counter()
+
+    def register_replies(reply_items, comment_id_parent, author_parent):
+        # Grava as respostas de um comentário e atualiza as contagens da rede.
+        for reply_item in reply_items:
+            snippet = reply_item["snippet"]
+            author_reply = sys.intern(snippet["authorDisplayName"])
+            text = snippet["textOriginal"] if collect_text else ""
+            write_row((reply_item["id"], author_reply, text, snippet["likeCount"], snippet["publishedAt"], comment_id_parent))
+            register_author(author_reply, 0)  # garante o nó do autor da resposta
+            edges[(author_reply, author_parent)] += 1
+            n_replies[author_parent] += 1
+
+    def fetch_thread_page(api_key, page_token):
+        return chamar_api(
+            client,
+            "commentThreads",
+            api_key,
+            part="snippet,replies",
+            videoId=video_id,
+            textFormat="plainText",
+            maxResults=100,
+            pageToken=page_token,
+            fields=fields_threads
+        )
+
+    def register_threads(thread_items):
+        # Grava os comentários principais de uma página e devolve os que ainda
+        # precisam ter as respostas buscadas com comments.list.
+        items_with_replies = []
+        for item in thread_items:
+            thread_snippet = item["snippet"]
+            top_comment = thread_snippet["topLevelComment"]
+            snippet = top_comment["snippet"]
+            author_parent = sys.intern(snippet["authorDisplayName"])
+            comment_id_parent = top_comment["id"]
+            text = snippet["textOriginal"] if collect_text else ""
+            write_row((comment_id_parent, author_parent, text, snippet["likeCount"], snippet["publishedAt"], None))
+            n_comments[author_parent] += 1
+            total_replies = thread_snippet["totalReplyCount"]
+            if total_replies > 0:
+                # A API já devolve até 5 respostas junto do comentário; só é
+                # preciso buscá-las à parte quando a lista veio incompleta.
+                inline_replies = item.get("replies", {}).get("comments", [])
+                if total_replies > len(inline_replies):
+                    items_with_replies.append((comment_id_parent, author_parent, None))
+                    reply_sources['comments_list'] += 1
+                else:
+                    register_replies(inline_replies, comment_id_parent, author_parent)
+                    reply_sources['inline'] += 1
+        return items_with_replies
+
+    def batch_failed(pending, erro):
+        # Um lote que falhou volta inteiro para a fila; os comentários que já falharam
+        # TENTATIVAS_LOTE vezes vão para 'replies_failed', e a página não é dada como concluída.
+        motivo = getattr(getattr(erro, "response", None), "status_code", None) or type(erro).__name__
+        print(f"\nAVISO: falha ({motivo}) ao buscar as respostas dos comentários: "
+              f"{', '.join(comment_id_parent for comment_id_parent, _, _ in pending)}")
+        retry = []
+        for p in pending:
+            reply_failures[p[0]] += 1
+            (retry if reply_failures[p[0]] < TENTATIVAS_LOTE else replies_failed).append(p)
+        return retry
+
+    async def fetch_replies_batch(pending, api_key):
+        # Busca uma página de respostas para cada comentário em 'pending' com
+        # uma única requisição de lote. Devolve os comentários que ainda têm
+        # páginas seguintes, já com o 'pageToken' da próxima página.
         try:
-            request_threads = youtube.commentThreads().list(
-                part="snippet",
-                videoId=video_id,
-                textFormat="plainText",
-                maxResults=100,
-                pageToken=next_page_token_threads
-            )
-            response_threads = request_threads.execute()
-
-            for item in response_threads["items"]:
-                top_comment = item["snippet"]["topLevelComment"]
-                author_parent = top_comment["snippet"]["authorDisplayName"]
-                comment_id_parent = top_comment["id"]
-                all_comments.append({'comment_id': comment_id_parent, 'author': author_parent, 'text': top_comment["snippet"]["textOriginal"], 'likes': top_comment["snippet"]["likeCount"], 'timestamp': top_comment["snippet"]["publishedAt"], 'parent_id': None})
-                if author_parent not in nodes:
-                    nodes[author_parent] = {'total_comments': 0, 'total_replies_received': 0}
-                nodes[author_parent]['total_comments'] += 1
-                if item["snippet"]["totalReplyCount"] > 0:
-                    next_page_token_replies = None
-                    while True:
-                        try:
-                            request_replies = youtube.comments().list(part="snippet", parentId=comment_id_parent, maxResults=100, pageToken=next_page_token_replies)
-                            response_replies = request_replies.execute()
-                            for reply_item in response_replies["items"]:
-                                author_reply = reply_item["snippet"]["authorDisplayName"]
-                                all_comments.append({'comment_id': reply_item["id"],'author': author_reply,'text': reply_item["snippet"]["textOriginal"],'likes': reply_item["snippet"]["likeCount"],'timestamp': reply_item["snippet"]["publishedAt"],'parent_id': comment_id_parent})
-                                if author_reply not in nodes:
-                                    nodes[author_reply] = {'total_comments': 0, 'total_replies_received': 0}
-                                edges.append({'source': author_reply, 'target': author_parent})
-                                nodes[author_parent]['total_replies_received'] += 1
-                            next_page_token_replies = response_replies.get("nextPageToken")
-                            if not next_page_token_replies:
-                                break
-                        except HttpError:
-                            break
-            
-            progress_bar.update(len(response_threads["items"]))
-            next_page_token_threads = response_threads.get("nextPageToken")
-            if not next_page_token_threads:
-                break
-        
-        except HttpError as e:
+            responses = await chamar_api_em_lote(client, "comments", api_key, [
+                {"part": "snippet", "parentId": comment_id_parent, "maxResults": 100, "pageToken": page_token, "fields": fields_replies}
+                for comment_id_parent, _, page_token in pending
+            ])
+        except httpx.HTTPStatusError as e:
             if 'quotaExceeded' in str(e):
-                current_key_index += 1
-                if current_key_index < len(api_keys):
-                    api_key = api_keys[current_key_index]
-                    print(f"\nCOTA ESGOTADA. Trocando para a Chave de API #{current_key_index + 1}...")
-                    youtube = build("youtube", "v3", developerKey=api_key)
-                    continue
-                else:
+                raise
+            return batch_failed(pending, e)
+        except httpx.TransportError as e:
+            return batch_failed(pending, e)
+        next_pending = []
+        for (comment_id_parent, author_parent, _), response_replies in zip(pending, responses):
+            if response_replies is None:
+                # Erro só nesta sub-requisição (ex: comentário removido): as demais seguem.
+                print(f"\nAVISO: respostas do comentário {comment_id_parent} ignoradas (erro na sub-requisição do lote).")
+                continue
+            register_replies(response_replies["items"], comment_id_parent, author_parent)
+            next_page_token_replies = response_replies.get("nextPageToken")
+            if next_page_token_replies:
+                next_pending.append((comment_id_parent, author_parent, next_page_token_replies))
+        return next_pending
+
+    async def reply_worker(api_key):
+        # Consome a fila de respostas pendentes com uma única chave, em lotes de
+        # até TAMANHO_LOTE comentários. Quando a cota da chave se esgota, devolve
+        # o lote à fila para as demais chaves e encerra.
+        while api_key in active_keys and not reply_queue.empty() and not replies_failed:
+            batch = []
+            while len(batch) < TAMANHO_LOTE and not reply_queue.empty():
+                batch.append(reply_queue.get_nowait())
+            try:
+                next_pending = await fetch_replies_batch(batch, api_key)
+            except httpx.HTTPStatusError:
+                if api_key in active_keys:
+                    active_keys.remove(api_key)
+                    print(f"\nCOTA ESGOTADA na Chave de API #{api_keys.index(api_key) + 1}.")
+                next_pending = batch
+            for p in next_pending:
+                reply_queue.put_nowait(p)
+
+    # Uma coleta interrompida (ex: cotas esgotadas) é retomada da última página
+    # concluída: o CSV é cortado no ponto salvo e as contagens são refeitas a partir dele.
+    state = carregar_estado(state_path, video_id)
+    next_page_token_threads = state.get('thread_token')
+    if state:
+        print("Retomando a coleta interrompida a partir da última página salva.")
+        with open(comments_path, 'r+b') as f:
+            f.truncate(state['offset'])
+        reconstruir_contagens(comments_path, n_comments, n_replies, edges)
+
+    # Os comentários são gravados no CSV assim que chegam, sem acumular em memória.
+    with open(comments_path, 'a' if state else 'w', newline='', encoding='utf-8-sig', buffering=1 << 20) as comments_file:
+        writer = csv.writer(comments_file)
+        write_row = writer.writerow
+        if not state:
+            writer.writerow(('comment_id', 'author', 'text', 'likes', 'timestamp', 'parent_id'))
+
+        # Um único cliente HTTP/2 compartilhado: as requisições simultâneas são
+        # multiplexadas sobre poucas conexões persistentes com o host da API.
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        async with httpx.AsyncClient(base_url=API_URL, http2=True, limits=limits, headers=HEADERS, timeout=30) as client:
+            print(f"Conexão com a API estabelecida usando {len(api_keys)} chave(s).")
+
+            # PARTE 1: COLETA DE COMENTÁRIOS E RESPOSTAS
+            print("\nIniciando a coleta de dados completos...")
+        
+            # <-- MUDANÇA AQUI: Adicionado 'bar_format' para simplificar a saída.
+            progress_bar = tqdm(desc="Comentários Principais Processados", unit=" cmt", bar_format="{desc}: {n_fmt} {unit}")
+        
+            next_page_request = None
+            while True:
+                if not active_keys:
                     print("\nTODAS AS COTAS DE API FORAM ESGOTADAS PARA HOJE.")
                     break
-            else:
-                print(f"\nOcorreu um erro na chamada da API: {e}")
-                raise e
-    
-    progress_bar.close()
-    print("\nColeta finalizada ou interrompida por falta de cotas.")
+                # A página antecipada fica ligada à chave que a pediu: se ela falhar por cota,
+                # é essa chave que sai da lista, e a página é pedida de novo com a próxima.
+                if next_page_request is not None:
+                    api_key, request = next_page_request
+                else:
+                    api_key = active_keys[0]
+                    request = fetch_thread_page(api_key, next_page_token_threads)
+                next_page_request = None
+                try:
+                    response_threads = await request
+                    next_page_token = response_threads.get("nextPageToken")
+                    if next_page_token:
+                        # A próxima página já é pedida enquanto esta é processada.
+                        next_page_request = (api_key, asyncio.create_task(fetch_thread_page(api_key, next_page_token)))
+
+                    items_with_replies = register_threads(response_threads["items"])
+                    page_size = len(response_threads["items"])
+                    # Os textos já estão no CSV; a página não fica em memória durante a busca das respostas.
+                    del response_threads
+
+                    # Busca as respostas da página com WORKERS_POR_CHAVE workers por chave;
+                    # os comentários com mais páginas voltam para a fila até acabarem.
+                    for p in items_with_replies:
+                        reply_queue.put_nowait(p)
+                    while active_keys and not reply_queue.empty() and not replies_failed:
+                        await asyncio.gather(*[reply_worker(key) for key in active_keys for _ in range(WORKERS_POR_CHAVE)])
+                    if replies_failed:
+                        # Página incompleta: o estado salvo continua apontando para ela.
+                        print(f"\nNão foi possível buscar as respostas de {len(replies_failed)} comentário(s) "
+                              "após várias tentativas. A coleta para aqui e será retomada a partir desta página.")
+                        break
+                    if not reply_queue.empty():
+                        # Página incompleta: o estado salvo continua apontando para ela.
+                        print("\nTODAS AS COTAS DE API FORAM ESGOTADAS PARA HOJE.")
+                        break
+                
+                    progress_bar.update(page_size)
+                    next_page_token_threads = next_page_token
+                    if not next_page_token_threads:
+                        if os.path.exists(state_path):
+                            os.remove(state_path)
+                        break
+                    comments_file.flush()
+                    salvar_estado(state_path, video_id, next_page_token_threads, comments_file.tell())
+            
+                except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                    if 'quotaExceeded' in str(e):
+                        if api_key in active_keys:
+                            active_keys.remove(api_key)
+                        if active_keys:
+                            print(f"\nCOTA ESGOTADA. Trocando para a Chave de API #{api_keys.index(active_keys[0]) + 1}...")
+                        continue
+                    else:
+                        print(f"\nOcorreu um erro na chamada da API: {e}")
+                        if next_page_request is not None:
+                            next_page_request[1].cancel()
+                        progress_bar.close()
+                        raise e
+
+            # Descarta a página pedida antecipadamente quando a coleta é interrompida.
+            if next_page_request is not None:
+                next_page_request[1].cancel()
+                await asyncio.gather(next_page_request[1], return_exceptions=True)
+        
+            progress_bar.close()
+    print("\nColeta finalizada ou interrompida (cotas esgotadas ou falhas da API).")
+    if reply_sources:
+        print(f"Comentários com respostas já incluídas na página: {reply_sources['inline']}; "
+              f"com respostas buscadas via comments.list: {reply_sources['comments_list']}.")
     
     if edges:
         print("\nProcessando e salvando os arquivos da rede...")
-        df_arestas = pd.DataFrame([{'source': k[0], 'target': k[1], 'peso': v} for k, v in Counter((e['source'], e['target']) for e in edges).items()])
-        df_nos = pd.DataFrame.from_dict(nodes, orient='index', columns=['total_comments', 'total_replies_received'])
-        df_nos.index.name = 'id'
-        df_nos.reset_index(inplace=True)
-        df_arestas.to_csv('data/raw/rede_usuarios_arestas.csv', index=False, encoding='utf-8-sig')
-        df_nos.to_csv('data/raw/rede_usuarios_nos.csv', index=False, encoding='utf-8-sig')
+        with open(os.path.join(out_dir, EDGES_FILE), 'w', newline='', encoding='utf-8-sig', buffering=1 << 20) as f:
+            w = csv.writer(f)
+            w.writerow(('source', 'target', 'peso'))
+            w.writerows((s, t, p) for (s, t), p in edges.items())
+        with open(os.path.join(out_dir, NODES_FILE), 'w', newline='', encoding='utf-8-sig', buffering=1 << 20) as f:
+            w = csv.writer(f)
+            w.writerow(('id', 'total_comments', 'total_replies_received'))
+            w.writerows((a, c, n_replies.get(a, 0)) for a, c in n_comments.items())
         print("Arquivos de rede gerados com sucesso.")
-    if all_comments:
-        print("\nProcessando e salvando o arquivo de comentários com texto...")
-        df_comments = pd.DataFrame(all_comments)
-        df_comments.to_csv('data/raw/comentarios.csv', index=False, encoding='utf-8-sig')
-        print("Arquivo de comentários gerado com sucesso.")
 
 # PONTO DE ENTRADA DO SCRIPT
 if __name__ == "__main__":
@@ -126,4 +427,4 @@ if __name__ == "__main__":
     if not api_keys_list:
         print("ERRO: Nenhuma chave de API foi encontrada no arquivo .env (ex: YOUTUBE_API_KEY_1, YOUTUBE_API_KEY_2)")
     else:
-        coletar_dados_completos(video_id=VIDEO_ID, api_keys=api_keys_list)
\ No newline at end of file
+        asyncio.run(coletar_dados_completos(video_id=VIDEO_ID, api_keys=api_keys_list))
\ No newline at end of file
@@ -16,7 +16,9 @@ Outputs:
     edges_similarity_video_video.csv (if built)
     graph_comment_bipartite.graphml  (if comments collected)
     graph_similarity.graphml         (if built)
-    raw/ (json dumps per API page for reproducibility)
+    (every .csv table is also written as .parquet, zstd-compressed)
+    raw/ (gzipped json dumps per API page for reproducibility)
+    .cache/ (cached TF-IDF fits, reused when tuning --top-k / --min-sim)
 
 Usage examples:
   python yt_collect.py --query "inteligência artificial" --max-seeds 50 --depth 0 --outdir data/ai --build-similarity
@@ -30,36 +32,37 @@ Notes:
 import os
 import sys
 import time
-import json
+import gzip
 import math
 import argparse
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional, Set
+from typing import List, Dict, Any, Tuple, Optional, Set, Callable
 
 from dotenv import load_dotenv
+import orjson
+import numpy as np
 import pandas as pd
 import networkx as nx
 from tqdm import tqdm
 
-# sklearn for similarity graph
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-
 # Google API client
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 from googleapiclient.errors import HttpError
 
 # ------------------------ Helpers ------------------------
 
 def chunked(iterable, size):
-    buf = []
-    for x in iterable:
-        buf.append(x)
-        if len(buf) >= size:
-            yield buf
-            buf = []
-    if buf:
-        yield buf
+    if isinstance(iterable, Sequence):
+        # Lists/tuples: one C-level slice per chunk
+        return (iterable[i:i + size] for i in range(0, len(iterable), size))
+    it = iter(iterable)
+    return iter(lambda: list(islice(it, size)), [])
 
 def safe_get(d: dict, path: List[str], default=None):
     cur = d
@@ -73,18 +76,46 @@ def safe_get(d: dict, path: List[str], default=None):
 def ensure_outdirs(outdir: Path):
     (outdir / "raw").mkdir(parents=True, exist_ok=True)
 
+def write_table(df: pd.DataFrame, outdir: Path, name: str):
+    """
+    Write df as outdir/name.csv and as outdir/name.parquet (pyarrow, zstd).
+    The Parquet copy keeps dtypes and re-reads much faster than the CSV.
+    """
+    df.to_csv(outdir / f"{name}.csv", index=False)
+    df.to_parquet(outdir / f"{name}.parquet", engine="pyarrow", compression="zstd", index=False)
+
 # ------------------------ YouTube API ------------------------
 
 class YouTubeClient:
     def __init__(self, api_key: str, region_code: Optional[str]=None, relevance_language: Optional[str]=None):
         self.api_key = api_key
-        self.service = build("youtube", "v3", developerKey=api_key)
+        self._local = threading.local()
         self.region_code = region_code
         self.relevance_language = relevance_language
 
-    def _call(self, request, raw_path: Path, kind: str):
+    @property
+    def service(self):
+        """
+        Per-thread API service: the httplib2 transport under googleapiclient is not
+        thread-safe, so each worker thread builds (once) and reuses its own.
+        build_http() keeps googleapiclient's transport defaults (including its 308
+        redirect handling); only the socket timeout is lowered to 30s.
+        """
+        service = getattr(self._local, "service", None)
+        if service is None:
+            http = build_http()
+            http.timeout = 30
+            service = build("youtube", "v3", developerKey=self.api_key, http=http)
+            self._local.service = service
+        return service
+
+    def _call(self, request, raw_path: Path, kind: str, drop_keys: Tuple[str, ...] = (),
+              next_request: Optional[Callable[[str], Any]] = None):
         """
         Execute a request with error handling and store the raw response page-by-page.
+        Keys in drop_keys are left out of the saved page (the yielded response is intact).
+        next_request(page_token) builds the request for the following page; by default
+        the previous request is repeated with the new token (list_next).
         """
         page_idx = 0
         while True:
@@ -103,17 +134,18 @@ class YouTubeClient:
                 except Exception:
                     raise
 
-            # Save raw page
-            raw_file = raw_path / f"{kind}_page{page_idx:04d}.json"
-            with open(raw_file, "w", encoding="utf-8") as f:
-                json.dump(response, f, ensure_ascii=False, indent=2)
+            # Save raw page (compact JSON, gzip-compressed)
+            raw_file = raw_path / f"{kind}_page{page_idx:04d}.json.gz"
+            saved = {k: v for k, v in response.items() if k not in drop_keys} if drop_keys else response
+            with gzip.open(raw_file, "wb", compresslevel=3) as f:
+                f.write(orjson.dumps(saved))
 
             yield response
 
             page_token = response.get("nextPageToken")
             if not page_token:
                 break
-            request = request.list_next(request, response)
+            request = next_request(page_token) if next_request else request.list_next(request, response)
             page_idx += 1
 
     def search_videos(self, query: str, max_results: int = 50) -> List[str]:
@@ -135,23 +167,38 @@ class YouTubeClient:
         raise NotImplementedError("Use search_videos_to_file for raw saving.")
 
     def search_videos_to_file(self, query: str, max_results: int, raw_path: Path) -> List[str]:
+        """
+        Page through search.list until max_results IDs are collected. Each page asks only
+        for the IDs still missing (at most 50), and returning from inside the loop stops
+        _call before it requests (or saves) another page.
+        """
         ids: List[str] = []
-        req = self.service.search().list(
-            part="id",
-            q=query,
-            type="video",
-            maxResults=50,
-            regionCode=self.region_code,
-            relevanceLanguage=self.relevance_language,
-            safeSearch="none"
-        )
-        for page in self._call(req, raw_path, kind=f"search_{slugify(query)}"):
+        if max_results <= 0:
+            return ids
+
+        def search_request(page_token: Optional[str] = None):
+            return self.service.search().list(
+                part="id",
+                q=query,
+                type="video",
+                maxResults=min(50, max_results - len(ids)),
+                pageToken=page_token,
+                regionCode=self.region_code,
+                relevanceLanguage=self.relevance_language,
+                safeSearch="none"
+            )
+
+        pages = self._call(search_request(), raw_path, kind=f"search_{slugify(query)}",
+                           drop_keys=("etag", "pageInfo"), next_request=search_request)
+        for page in pages:
             for item in page.get("items", []):
                 vid = safe_get(item, ["id", "videoId"])
                 if vid:
                     ids.append(vid)
                 if len(ids) >= max_results:
                     return ids
+            if not page.get("items"):
+                break  # an empty page with a nextPageToken would otherwise page forever
         return ids
 
     def videos_list(self, ids: List[str], raw_path: Path) -> List[Dict[str, Any]]:
@@ -189,6 +236,7 @@ class YouTubeClient:
 
 # ------------------------ Core pipeline ------------------------
 
+@lru_cache(maxsize=1024)
 def slugify(s: str) -> str:
     return "".join(ch.lower() if ch.isalnum() else "_" for ch in s).strip("_")
 
@@ -220,64 +268,193 @@ def fetch_video_metadata(yt: YouTubeClient, video_ids: List[str], outdir: Path)
             "duration": it.get("contentDetails", {}).get("duration"),
         })
     df = pd.DataFrame(rows).drop_duplicates(subset=["videoId"])
-    df.to_csv(outdir / "nodes_videos.csv", index=False)
+    write_table(df, outdir, "nodes_videos")
     return df
 
-def collect_comments_bipartite(yt: YouTubeClient, video_ids: List[str], comments_per_video: int, outdir: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def collect_comments_bipartite(yt: YouTubeClient, video_ids: List[str], comments_per_video: int, outdir: Path, max_workers: int = 8) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Returns (users_df, edges_user_video_df)
+    Comments for different videos are fetched concurrently by max_workers threads;
+    results are merged afterwards in the original video order.
     """
-    all_edges = []
-    users = {}
-    for vid in tqdm(video_ids, desc="Comments"):
-        try:
-            items = yt.get_top_level_comments(vid, comments_per_video, outdir / "raw")
-        except HttpError as e:
-            print(f"[WARN] Skipping comments for {vid} due to HttpError: {e}", file=sys.stderr)
-            continue
-        for it in items:
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {ex.submit(yt.get_top_level_comments, vid, comments_per_video, outdir / "raw"): vid for vid in video_ids}
+        for fut in tqdm(as_completed(futures), total=len(futures), desc="Comments"):
+            vid = futures[fut]
+            try:
+                results[vid] = fut.result()
+            except HttpError as e:
+                print(f"[WARN] Skipping comments for {vid} due to HttpError: {e}", file=sys.stderr)
+
+    # one list per output column (no per-comment dicts)
+    src: List[str] = []
+    tgt: List[str] = []
+    cid: List[Optional[str]] = []
+    lc: List[Optional[int]] = []
+    pub: List[Optional[str]] = []
+    txt: List[Optional[str]] = []
+    seen_users: Set[str] = set()
+    uid: List[str] = []
+    name: List[Optional[str]] = []
+    for vid in video_ids:
+        for it in results.get(vid, []):
             top = it.get("snippet", {}).get("topLevelComment", {})
             sn = top.get("snippet", {})
-            author_channel_id = safe_get(sn, ["authorChannelId", "value"])
-            author_display_name = sn.get("authorDisplayName")
-            comment_id = top.get("id")
-            like_count = sn.get("likeCount")
-            published_at = sn.get("publishedAt")
+            author_channel_id = sn.get("authorChannelId", {}).get("value")
             text = sn.get("textDisplay") or sn.get("textOriginal") or sn.get("text")
 
             if author_channel_id:
-                users.setdefault(author_channel_id, {"userId": author_channel_id, "displayName": author_display_name})
-                all_edges.append({
-                    "sourceUserId": author_channel_id,
-                    "targetVideoId": vid,
-                    "edge": "commented",
-                    "commentId": comment_id,
-                    "likeCount": like_count,
-                    "publishedAt": published_at,
-                    "text": text.replace("\n", " ") if isinstance(text, str) else text
-                })
-
-    users_df = pd.DataFrame(list(users.values()))
-    edges_df = pd.DataFrame(all_edges)
+                if author_channel_id not in seen_users:
+                    seen_users.add(author_channel_id)
+                    uid.append(author_channel_id)
+                    name.append(sn.get("authorDisplayName"))
+                src.append(author_channel_id)
+                tgt.append(vid)
+                cid.append(top.get("id"))
+                lc.append(sn.get("likeCount"))
+                pub.append(sn.get("publishedAt"))
+                txt.append(text.replace("\n", " ") if isinstance(text, str) else text)
+
+    users_df = pd.DataFrame({"userId": uid, "displayName": name})
+    edges_df = pd.DataFrame({
+        "sourceUserId": src,
+        "targetVideoId": tgt,
+        "edge": ["commented"] * len(src),
+        "commentId": cid,
+        "likeCount": lc,
+        "publishedAt": pub,
+        "text": txt,
+    })
     if not users_df.empty:
-        users_df.to_csv(outdir / "nodes_users.csv", index=False)
+        write_table(users_df, outdir, "nodes_users")
     if not edges_df.empty:
-        edges_df.to_csv(outdir / "edges_comments_user_video.csv", index=False)
+        write_table(edges_df, outdir, "edges_comments_user_video")
 
     # Build bipartite graph and save GraphML
     if not users_df.empty and not edges_df.empty:
         B = nx.Graph()
-        # add users with bipartite=0, videos with bipartite=1
-        B.add_nodes_from(users_df["userId"].tolist(), bipartite=0, kind="user")
-        # For video nodes we need their ids; from edges
-        video_ids_in_edges = edges_df["targetVideoId"].unique().tolist()
-        B.add_nodes_from(video_ids_in_edges, bipartite=1, kind="video")
-        # add edges
-        for _, row in edges_df.iterrows():
-            B.add_edge(row["sourceUserId"], row["targetVideoId"], edge=row["edge"], commentId=row["commentId"])
-        nx.write_graphml(B, outdir / "graph_comment_bipartite.graphml")
+        # users with bipartite=0, videos with bipartite=1 (videos that received comments)
+        B.add_nodes_from(uid, bipartite=0, kind="user")
+        B.add_nodes_from(dict.fromkeys(tgt), bipartite=1, kind="video")
+        # straight from the column lists: no Series or per-row lookups
+        B.add_edges_from((u, v, {"edge": "commented", "commentId": c}) for u, v, c in zip(src, tgt, cid))
+        nx.write_graphml_lxml(B, outdir / "graph_comment_bipartite.graphml")
     return users_df, edges_df
 
+DENSE_MAX_ROWS = 3000  # below this, the full similarity matrix fits comfortably in memory
+
+def _top_k_sorted(cols, vals, top_k: int):
+    """
+    Keep the top_k largest vals (and their cols), sorted desc.
+    """
+    if len(vals) > top_k:
+        keep = np.argpartition(-vals, top_k)[:top_k]
+        cols, vals = cols[keep], vals[keep]
+    order = np.argsort(-vals, kind="stable")
+    return cols[order], vals[order]
+
+def top_similar(X, top_k: int, min_sim: float):
+    """
+    Yield (row_idx, neighbour_idxs, similarities) for every row of the L2-normalized
+    matrix X, keeping at most top_k neighbours with similarity >= min_sim, sorted desc.
+    Every path applies the same rule: only pairs sharing at least one term (similarity
+    > 0) can be neighbours, so min_sim <= 0 links nothing that min_sim = 0 would not.
+    Uses sparse_dot_topn when installed; otherwise small corpora are ranked on one dense
+    matrix (from the sparse product X @ X.T) and large ones block by block.
+    """
+    # Optional: fused sparse matmul + top-k selection (pip install sparse-dot-topn).
+    # Imported here so runs that never build similarity do not load it (and scipy).
+    try:
+        from sparse_dot_topn import sp_matmul_topn
+    except ImportError:
+        sp_matmul_topn = None
+
+    if sp_matmul_topn is not None:
+        # top_k + 1 because the best match of each row is the row itself. sp_matmul_topn
+        # keeps values strictly above threshold, so ask one float32 step lower and
+        # apply >= min_sim here, like the other paths.
+        threshold = float(np.nextafter(np.float32(min_sim), np.float32(-np.inf)))
+        C = sp_matmul_topn(X, X.T.tocsr(), top_n=top_k + 1, threshold=threshold, sort=True, n_threads=os.cpu_count())
+        for i in range(C.shape[0]):
+            lo, hi = C.indptr[i], C.indptr[i + 1]
+            cols, vals = C.indices[lo:hi], C.data[lo:hi]
+            keep = (cols != i) & (vals >= min_sim)
+            yield i, cols[keep][:top_k], vals[keep][:top_k]
+        return
+
+    n = X.shape[0]
+    if n <= DENSE_MAX_ROWS:
+        # Small corpus: one sparse product densified to N x N, then rank every row at once
+        S = (X @ X.T).toarray()
+        np.fill_diagonal(S, -np.inf)  # skip self
+        k = min(top_k, n - 1)
+        if k <= 0:
+            return
+        idx = np.argpartition(-S, k - 1, axis=1)[:, :k]
+        vals = np.take_along_axis(S, idx, axis=1)
+        order = np.argsort(-vals, axis=1, kind="stable")
+        idx = np.take_along_axis(idx, order, axis=1)
+        vals = np.take_along_axis(vals, order, axis=1)
+        keep = (vals >= min_sim) & (vals > 0)  # zeros are never stored by the sparse paths
+        for i in range(n):
+            yield i, idx[i][keep[i]], vals[i][keep[i]]
+        return
+
+    # Large corpus: chunked sparse products, so only a few 1000 x N blocks are alive at a time.
+    # scipy's sparse matmul releases the GIL, so blocks run in parallel on threads.
+    from joblib import Parallel, delayed
+
+    def process_block(start: int, end: int):
+        sim_block = (X[start:end] @ X.T).tocsr()  # sparse (end-start) x N
+        out = []
+        for i in range(sim_block.shape[0]):
+            src_idx = start + i
+            lo, hi = sim_block.indptr[i], sim_block.indptr[i + 1]
+            cols, vals = sim_block.indices[lo:hi], sim_block.data[lo:hi]
+            # skip self and anything below the threshold
+            mask = (vals >= min_sim) & (cols != src_idx)
+            cols, vals = _top_k_sorted(cols[mask], vals[mask], top_k)
+            out.append((src_idx, cols, vals))
+        return out
+
+    step = 1000
+    blocks = Parallel(n_jobs=-1, backend="threading", return_as="generator")(
+        delayed(process_block)(start, min(start + step, n)) for start in range(0, n, step)
+    )
+    for block in blocks:  # results arrive in block order
+        yield from block
+
+# Portuguese stop words, lowercase and without accents (matching strip_accents="unicode")
+PT_STOP_WORDS = (
+    "a", "ao", "aos", "aquela", "aquelas", "aquele", "aqueles", "aquilo", "as", "ate",
+    "com", "como", "da", "das", "de", "dela", "delas", "dele", "deles", "depois", "do", "dos",
+    "e", "ela", "elas", "ele", "eles", "em", "entre", "era", "essa", "essas", "esse", "esses",
+    "esta", "estao", "estas", "estava", "este", "estes", "eu", "foi", "for", "foram",
+    "ha", "isso", "isto", "ja", "la", "lhe", "lhes", "mais", "mas", "me", "mesmo", "meu", "meus",
+    "minha", "minhas", "muito", "na", "nao", "nas", "nem", "no", "nos", "nossa", "nosso", "num", "numa",
+    "o", "os", "ou", "para", "pela", "pelas", "pelo", "pelos", "por", "pra", "qual", "quando", "que",
+    "quem", "se", "sem", "ser", "seu", "seus", "so", "sua", "suas", "tambem", "te", "tem", "ter",
+    "teu", "tua", "um", "uma", "umas", "uns", "voce", "voces", "vos",
+)
+
+def _fit_tfidf(texts: Tuple[str, ...], max_features: int, ngram_range: Tuple[int, int], min_df: int,
+               stop_words: Tuple[str, ...] = PT_STOP_WORDS):
+    """
+    Fit the TF-IDF vectorizer and return (vectorizer, X). Wrapped with joblib.Memory
+    by build_similarity_graph, so re-runs on the same texts skip the fit entirely.
+    Sublinear TF (1 + log tf) keeps long descriptions from dominating the similarity.
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer  # imported only when similarity is built
+
+    vectorizer = TfidfVectorizer(
+        max_features=max_features, ngram_range=ngram_range, min_df=min_df,
+        sublinear_tf=True, strip_accents="unicode", lowercase=True, stop_words=list(stop_words),
+        dtype=np.float32, norm="l2",
+    )
+    X = vectorizer.fit_transform(texts)
+    return vectorizer, X
+
 def build_similarity_graph(videos_df: pd.DataFrame, outdir: Path, top_k: int = 5, min_sim: float = 0.25) -> pd.DataFrame:
     """
     Build a similarity graph using TF-IDF of title + description.
@@ -285,42 +462,41 @@ def build_similarity_graph(videos_df: pd.DataFrame, outdir: Path, top_k: int = 5
     """
     if videos_df.empty:
         return pd.DataFrame()
+    from joblib import Memory
 
     texts = ((videos_df["title"].fillna("") + " " + videos_df["description"].fillna("")).astype(str)).tolist()
-    vectorizer = TfidfVectorizer(max_features=20000, ngram_range=(1,2), min_df=2)
-    X = vectorizer.fit_transform(texts)
-    # Compute cosine similarity in chunks to control memory
-    ids = videos_df["videoId"].tolist()
-    edges = []
-    # Chunked approach for large sets
-    # For typical class projects (<5k videos), full matrix is feasible; here we do chunked to be safe
-    step = 1000 if X.shape[0] > 3000 else X.shape[0]
-    for start in range(0, X.shape[0], step):
-        end = min(start + step, X.shape[0])
-        sim_block = cosine_similarity(X[start:end], X)  # (end-start) x N
-        for i, row in enumerate(sim_block):
-            src_idx = start + i
-            # sort by similarity, skip self
-            ranked = sorted(((j, s) for j, s in enumerate(row) if j != src_idx), key=lambda t: t[1], reverse=True)
-            kept = 0
-            for j, s in ranked:
-                if s < min_sim:
-                    break  # since sorted desc, we can break once below threshold
-                edges.append({"source": ids[src_idx], "target": ids[j], "weight": float(s), "edge": "similar"})
-                kept += 1
-                if kept >= top_k:
-                    break
-
-    edges_df = pd.DataFrame(edges).drop_duplicates(subset=["source", "target"])
+    # cached under outdir/.cache, keyed on the texts and vectorizer parameters
+    fit_tfidf = Memory(outdir / ".cache", verbose=0).cache(_fit_tfidf)
+    vectorizer, X = fit_tfidf(tuple(texts), max_features=20000, ngram_range=(1, 2), min_df=2)
+    # TF-IDF rows are L2-normalized (norm="l2"), so the sparse product X @ X.T
+    # already holds the cosine similarities; only nonzero entries are ranked.
+    ids = videos_df["videoId"].to_numpy()
+    src, tgt, weight = [], [], []
+    for src_idx, cols, vals in top_similar(X, top_k, min_sim):
+        src.append(np.full(len(cols), src_idx))
+        tgt.append(cols)
+        weight.append(vals)
+    edges_df = pd.DataFrame(columns=["source", "target", "weight", "edge"])
+    if src:
+        src, tgt, weight = np.concatenate(src), np.concatenate(tgt), np.concatenate(weight)
+        # The graph is undirected: (i, j) and (j, i) are the same edge, so each pair
+        # is kept once as (min, max), in the order it was first emitted.
+        lo, hi = np.minimum(src, tgt), np.maximum(src, tgt)
+        _, first = np.unique(lo.astype(np.int64) * X.shape[0] + hi, return_index=True)
+        first.sort()
+        edges_df = pd.DataFrame({
+            "source": ids[lo[first]],
+            "target": ids[hi[first]],
+            "weight": weight[first].astype(float),
+            "edge": "similar",
+        })
     if not edges_df.empty:
-        edges_df.to_csv(outdir / "edges_similarity_video_video.csv", index=False)
+        write_table(edges_df, outdir, "edges_similarity_video_video")
         # Save as weighted graph
-        G = nx.Graph()
-        for _, row in videos_df.iterrows():
-            G.add_node(row["videoId"], **row.to_dict())
-        for _, row in edges_df.iterrows():
-            G.add_edge(row["source"], row["target"], weight=row["weight"], edge=row["edge"])
-        nx.write_graphml(G, outdir / "graph_similarity.graphml")
+        G = nx.from_pandas_edgelist(edges_df, "source", "target", edge_attr=["weight", "edge"])
+        # every video becomes a node (isolated ones included), with its metadata as attributes
+        G.add_nodes_from((rec["videoId"], rec) for rec in videos_df.to_dict("records"))
+        nx.write_graphml_lxml(G, outdir / "graph_similarity.graphml")
     return edges_df
 
 # ------------------------ CLI ------------------------
@@ -331,9 +507,10 @@ def main():
     parser.add_argument("--max-seeds", type=int, default=50, help="How many seed videos to collect from search.")
     parser.add_argument("--collect-comments", action="store_true", help="Collect top-level comments and build a user→video bipartite network.")
     parser.add_argument("--comments-per-video", type=int, default=200, help="Max top-level comments per video.")
+    parser.add_argument("--comment-workers", type=int, default=8, help="Videos whose comments are fetched in parallel.")
     parser.add_argument("--build-similarity", action="store_true", help="Build a similarity network between videos using TF-IDF (title+description).")
     parser.add_argument("--top-k", type=int, default=5, help="Top-k most similar neighbors per video (for similarity graph).")
-    parser.add_argument("--min-sim", type=float, default=0.25, help="Minimum cosine similarity to create an edge (0-1).")
+    parser.add_argument("--min-sim", type=float, default=0.25, help="Minimum cosine similarity to create an edge (0-1); videos sharing no term are never linked.")
     parser.add_argument("--outdir", type=str, required=True, help="Output directory.")
     parser.add_argument("--api-key", type=str, default=None, help="YouTube API key (fallback if .env not used).")
     parser.add_argument("--region-code", type=str, default=None, help="Bias search results to a specific country (e.g., BR). Overrides .env.")
@@ -363,9 +540,9 @@ def main():
     videos_df = fetch_video_metadata(yt, seeds, outdir)
 
     # 3) Optional: comments bipartite
-    if args.collect-comments if False else args.collect_comments:  # avoid hyphen var name
+    if args.collect_comments:
         users_df, edges_comments_df = collect_comments_bipartite(
-            yt, videos_df["videoId"].tolist(), args.comments_per_video, outdir
+            yt, videos_df["videoId"].tolist(), args.comments_per_video, outdir, max_workers=args.comment_workers
         )
         print(f"[INFO] Users collected: {0 if users_df is None else len(users_df)}")
         print(f"[INFO] Comment edges: {0 if edges_comments_df is None else len(edges_comments_df)}")